@@ -1,4 +1,5 @@
 import json
+import math
 import random
 import time
 import argparse
@@ -6,6 +7,27 @@ import os
 import csv
 from typing import List, Tuple, Dict, Any
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # Sem Numba: os kernels rodam como Python puro (ou com a extensão em Cython)
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    # Extensão opcional em Cython (ver setup.py e ga_pmsp_core.pyx)
+    import ga_pmsp_core as _core
+except ImportError:
+    _core = None
+
 
 # -------------------------------------------------------
 # 1. Leitura da instância
@@ -15,7 +37,8 @@ def load_instance(path: str):
     """
     Lê o arquivo .json no formato do gerador e retorna:
     - config: dicionário de configuração
-    - setup_matrix: matriz de tempos de setup (lista de listas)
+    - setup_matrix: matriz de tempos de setup (lista de listas), com a diagonal
+      (null no JSON) já convertida para 0.0
     - processing_times: lista de tempos de processamento p[i]
     - ready_times: lista de ready times r[i]
     """
@@ -23,7 +46,8 @@ def load_instance(path: str):
         data = json.load(f)
 
     config = data["configuracao"]
-    setup_matrix = data["matriz_setup"]
+    # null (diagonal) vira 0.0 uma única vez, na leitura
+    setup_matrix = [[0.0 if s is None else s for s in row] for row in data["matriz_setup"]]
     processing_times = data["tempos_processamento"]
     ready_times = data["ready_times"]
 
@@ -34,215 +58,730 @@ def load_instance(path: str):
 # 2. Decodificar um cromossomo em um cronograma e calcular o makespan
 # -------------------------------------------------------
 
+def prepare_arrays(processing_times: List[float],
+                   ready_times: List[float],
+                   setup_matrix: List[List[float]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte os dados da instância para arrays NumPy (float64) usados no GA.
+
+    Retorna:
+    - p: tempos de processamento
+    - r: ready times
+    - setup: matriz de setup com uma linha de zeros no início, de forma que
+      setup[last_job + 1, job] dê o setup (0.0 quando a máquina ainda está vazia,
+      isto é, last_job == -1)
+    """
+    p = np.asarray(processing_times, dtype=np.float64)
+    r = np.asarray(ready_times, dtype=np.float64)
+
+    s = np.asarray(setup_matrix, dtype=np.float64)
+    setup = np.vstack([np.zeros((1, s.shape[1])), s])
+
+    return p, r, setup
+
+
+def _kernel_inputs(setup: np.ndarray,
+                   p: np.ndarray,
+                   r: np.ndarray):
+    """
+    Dados da instância no formato esperado pelos kernels do GA: os próprios
+    arrays com Numba ou Cython, ou listas quando os kernels rodam como Python
+    puro (indexar listas é bem mais barato que indexar arrays elemento a elemento).
+    """
+    if HAS_NUMBA or _core is not None:
+        return setup, p, r
+    return setup.tolist(), p.tolist(), r.tolist()
+
+
 def decode_schedule(order: List[int],
                     n_machines: int,
-                    processing_times: List[float],
-                    ready_times: List[float],
-                    setup_matrix: List[List[float]]) -> Tuple[float, List[List[Tuple[int, float, float]]]]:
+                    processing_times: np.ndarray,
+                    ready_times: np.ndarray,
+                    setup_matrix: np.ndarray) -> Tuple[float, List[List[Tuple[int, float, float]]]]:
     """
     Transforma uma permutação de jobs em um cronograma em máquinas.
 
+    Espera os arrays gerados por prepare_arrays (setup_matrix com a linha de zeros).
+    As máquinas são avaliadas de forma vetorizada para cada job.
+    Usada apenas para montar o cronograma final; durante o GA, o custo é
+    calculado por _decode_makespan, que não monta o cronograma.
+
     Retorna:
     - makespan
     - schedule: lista de máquinas; cada máquina é uma lista de tuplas (job, start, end)
     """
     # Tempo em que cada máquina fica livre
-    machine_time = [0.0 for _ in range(n_machines)]
-    # Último job executado em cada máquina
-    last_job = [None for _ in range(n_machines)]
-    # Para guardar quando cada job termina (para calcular o makespan)
-    completion_times = [0.0 for _ in range(len(order))]
+    machine_time = np.zeros(n_machines, dtype=np.float64)
+    # Último job executado em cada máquina (-1 = nenhum)
+    last_job = np.full(n_machines, -1, dtype=np.int64)
+    # Maior tempo de término visto até agora
+    makespan = 0.0
     # Para guardar o cronograma de fato
     schedule: List[List[Tuple[int, float, float]]] = [[] for _ in range(n_machines)]
 
     for job in order:
-        best_machine = None
-        best_completion = float("inf")
-        best_start = 0.0
+        # Testa colocar este job em todas as máquinas de uma vez
+        # (setup da linha 0 é zero quando a máquina não tem job anterior)
+        t = machine_time + setup_matrix[last_job + 1, job]
 
-        # Testa colocar este job em cada máquina
-        for m in range(n_machines):
-            t = machine_time[m]
+        # Job só pode começar depois do ready time
+        start = np.fmax(t, ready_times[job])
+        completion = start + processing_times[job]
 
-            # Adiciona tempo de setup se houver job anterior na máquina
-            if last_job[m] is not None:
-                s = setup_matrix[last_job[m]][job]
-                if s is None:  # diagonal vem como null no JSON
-                    s = 0.0
-                t = t + s
+        # argmin devolve a primeira máquina em caso de empate
+        best_machine = int(completion.argmin())
+        best_completion = float(completion[best_machine])
 
-            # Job só pode começar depois do ready time
-            start = max(t, ready_times[job])
-            completion = start + processing_times[job]
+        # Atribui o job à melhor máquina encontrada
+        machine_time[best_machine] = best_completion
+        last_job[best_machine] = job
+        if best_completion > makespan:
+            makespan = best_completion
+        schedule[best_machine].append((int(job), float(start[best_machine]), best_completion))
+
+    return makespan, schedule
+
+
+@njit(cache=True, fastmath=True)
+def _decode_makespan(order, machine_time, last_job, setup, p, r):
+    """
+    Versão compilada (Numba) da decodificação, usada durante o GA.
+
+    Mesma lógica de decode_schedule, mas só calcula o makespan. machine_time e
+    last_job são buffers de trabalho pré-alocados (zerados / -1 pelo chamador).
+    """
+    n_machines = machine_time.shape[0]
+
+    for idx in range(order.shape[0]):
+        job = order[idx]
+        rj = r[job]
+        pj = p[job]
+        best_machine = 0
+        # Sentinela finita: com fastmath o LLVM pode assumir que não há infinitos
+        best_completion = 1e308
+
+        for m in range(n_machines):
+            # linha 0 de setup é zero (máquina sem job anterior)
+            t = machine_time[m] + setup[last_job[m] + 1, job]
+            # Forma sem desvio: compilada como uma instrução de máximo (maxsd)
+            start = t if t > rj else rj
+            completion = start + pj
 
             if completion < best_completion:
                 best_completion = completion
                 best_machine = m
-                best_start = start
 
-        # Atribui o job à melhor máquina encontrada
         machine_time[best_machine] = best_completion
         last_job[best_machine] = job
-        completion_times[job] = best_completion
-        schedule[best_machine].append((job, best_start, best_completion))
 
-    makespan = max(completion_times)
-    return makespan, schedule
+    makespan = 0.0
+    for m in range(n_machines):
+        if machine_time[m] > makespan:
+            makespan = machine_time[m]
+    return makespan
+
+
+@njit(parallel=True, cache=True)
+def _evaluate_batch_numba(orders_2d, setup, p, r, n_machines):
+    """
+    Avalia em paralelo (prange) várias permutações, uma por linha de orders_2d.
+    Cada iteração usa seus próprios buffers de trabalho.
+    """
+    n = orders_2d.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        machine_time = np.zeros(n_machines, dtype=np.float64)
+        last_job = np.full(n_machines, -1, dtype=np.int64)
+        out[i] = _decode_makespan(orders_2d[i], machine_time, last_job, setup, p, r)
+    return out
+
+
+def _evaluate_batch_cython(orders_2d, setup, p, r, n_machines):
+    """
+    Mesma lógica de _evaluate_batch_numba, com a decodificação da extensão
+    em Cython (sem paralelismo; os buffers de trabalho são reaproveitados).
+    """
+    n = orders_2d.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    machine_time = np.empty(n_machines, dtype=np.float64)
+    last_job = np.empty(n_machines, dtype=np.int64)
+    for i in range(n):
+        machine_time.fill(0.0)
+        last_job.fill(-1)
+        out[i] = _core.decode_schedule_c(orders_2d[i], machine_time, last_job, setup, p, r)
+    return out
+
+
+def _decode_makespan_list(order, n_machines, setup, p, r):
+    """
+    Mesma lógica de _decode_makespan sobre listas (Python puro); retorna só o
+    makespan. Guarda, para cada máquina, a linha de setup do seu último job.
+    """
+    machine_time = [0.0] * n_machines
+    setup_row = [setup[0]] * n_machines  # linha 0: máquina vazia
+    machines = range(n_machines)
+
+    for job in order:
+        rj = r[job]
+        pj = p[job]
+        best_machine = 0
+        best_completion = 1e308
+
+        for m in machines:
+            t = machine_time[m] + setup_row[m][job]
+            completion = (t if t > rj else rj) + pj
+
+            if completion < best_completion:
+                best_completion = completion
+                best_machine = m
+
+        machine_time[best_machine] = best_completion
+        setup_row[best_machine] = setup[job + 1]
+
+    return max(machine_time)
+
+
+def _evaluate_batch_list(orders_2d, setup, p, r, n_machines):
+    """Avalia várias permutações, uma por linha de orders_2d, com _decode_makespan_list."""
+    return np.array([_decode_makespan_list(order, n_machines, setup, p, r)
+                     for order in orders_2d.tolist()], dtype=np.float64)
 
 
 # -------------------------------------------------------
 # 3. Funções para o Algoritmo Genético
 # -------------------------------------------------------
 
-def evaluate(order: List[int],
-             n_machines: int,
-             processing_times: List[float],
-             ready_times: List[float],
-             setup_matrix: List[List[float]]) -> float:
+def evaluate_batch(orders_2d: np.ndarray,
+                   n_machines: int,
+                   processing_times: np.ndarray,
+                   ready_times: np.ndarray,
+                   setup_matrix: np.ndarray) -> np.ndarray:
     """
-    Calcula o custo (makespan) de uma solução.
+    Calcula o custo de várias soluções de uma vez (uma permutação int32 por linha),
+    em paralelo, com _evaluate_batch.
     """
-    makespan, _ = decode_schedule(order, n_machines, processing_times, ready_times, setup_matrix)
-    return makespan
+    return _evaluate_batch(orders_2d, setup_matrix, processing_times, ready_times, n_machines)
+
+
+# Gerador usado pelos operadores do GA. Os métodos são ligados como argumentos
+# padrão das funções (acesso local, sem passar pelo módulo random a cada sorteio);
+# genetic_algorithm o semeia a partir do gerador global, então random.seed continua valendo.
+_rng = random.Random()
 
 
-def create_individual(n_jobs: int,
+def create_population(pop_size: int,
+                      n_jobs: int,
                       n_machines: int,
-                      processing_times: List[float],
-                      ready_times: List[float],
-                      setup_matrix: List[List[float]]) -> Dict[str, Any]:
+                      processing_times: np.ndarray,
+                      ready_times: np.ndarray,
+                      setup_matrix: np.ndarray,
+                      warm_start: bool = False,
+                      _shuffle=_rng.shuffle,
+                      _randrange=_rng.randrange) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Cria um indivíduo aleatório:
-    - chromosome: permutação de 0..n_jobs-1
-    - cost: makespan da solução
+    Cria a população inicial aleatória, no formato SoA (structure of arrays):
+    - chroms: matriz int32 (pop_size, n_jobs); cada linha é uma permutação de 0..n_jobs-1
+    - costs: vetor float64 com o makespan de cada linha
+
+    Com warm_start=True, os primeiros indivíduos vêm de heurísticas clássicas
+    (menor ready time, maior tempo de processamento - LPT - e menor r + p);
+    os seguintes repetem essas ordens com 3 a 5 trocas aleatórias. O resto é aleatório.
+    """
+    chroms = np.empty((pop_size, n_jobs), dtype=np.int32)
+
+    n_warm = 0
+    if warm_start:
+        heuristics = [
+            np.argsort(ready_times, kind="stable"),
+            np.argsort(-processing_times, kind="stable"),
+            np.argsort(ready_times + processing_times, kind="stable"),
+        ]
+        n_warm = min(pop_size, 5)
+        for i in range(n_warm):
+            chromosome = heuristics[i % len(heuristics)].tolist()
+            if i >= len(heuristics):
+                # Pequena perturbação para diversificar
+                for _ in range(3 + _randrange(3)):
+                    a = _randrange(n_jobs)
+                    b = _randrange(n_jobs)
+                    chromosome[a], chromosome[b] = chromosome[b], chromosome[a]
+            chroms[i] = chromosome
+
+    for i in range(n_warm, pop_size):
+        chromosome = list(range(n_jobs))
+        _shuffle(chromosome)
+        chroms[i] = chromosome
+    k_setup, k_p, k_r = _kernel_inputs(setup_matrix, processing_times, ready_times)
+    costs = evaluate_batch(chroms, n_machines, k_p, k_r, k_setup)
+    return chroms, costs
+
+
+def tournament_selection(costs: np.ndarray, n_tournaments: int, k: int = 3) -> np.ndarray:
+    """
+    Seleção por torneio, vetorizada para todos os torneios de uma geração:
+    - para cada torneio, sorteia k índices da população
+    - retorna o índice do que tiver menor custo (makespan)
+
+    Retorna um array com n_tournaments índices de pais.
     """
-    chromosome = list(range(n_jobs))
-    random.shuffle(chromosome)
-    cost = evaluate(chromosome, n_machines, processing_times, ready_times, setup_matrix)
-    return {"chromosome": chromosome, "cost": cost}
+    idx = np.random.randint(0, costs.shape[0], (n_tournaments, k))
+    winners = idx[np.arange(n_tournaments), costs[idx].argmin(axis=1)]
+    return winners
 
 
-def tournament_selection(population: List[Dict[str, Any]], k: int = 3) -> Dict[str, Any]:
+def _cut_points(size: int, _randrange=_rng.randrange) -> Tuple[int, int]:
     """
-    Seleção por torneio:
-    - sorteia k indivíduos da população
-    - retorna o que tiver menor custo (makespan)
+    Sorteia os pontos de corte a < b do OX
+    (equivale a sorted(random.sample(range(size), 2)), mais barato).
     """
-    candidates = random.sample(population, k)
-    winner = min(candidates, key=lambda ind: ind["cost"])
-    return winner
+    a = _randrange(size)
+    b = _randrange(size - 1)
+    if b >= a:
+        b += 1
+    if a > b:
+        a, b = b, a
+    return a, b
 
 
-def order_crossover(parent1: List[int], parent2: List[int]) -> List[int]:
+def mutate_swap(chromosome: np.ndarray, mutation_rate: float = 0.02) -> bool:
     """
-    Crossover do tipo Order Crossover (OX) para permutações.
-    Retorna um filho.
+    Mutação por troca (swap):
+    para cada posição, com probabilidade mutation_rate, troca com outra posição aleatória.
+    Os sorteios são feitos de uma vez com np.random; o laço em Python
+    percorre apenas as posições sorteadas (~mutation_rate * size).
+    Retorna True se alguma troca alterou o cromossomo.
     """
-    size = len(parent1)
-    a, b = sorted(random.sample(range(size), 2))
+    size = chromosome.shape[0]
+    hits = np.flatnonzero(np.random.random(size) < mutation_rate)
+    partners = np.random.randint(0, size, hits.size)
 
-    # Inicializa filho com None
-    child = [None] * size
+    changed = False
+    for i, j in zip(hits.tolist(), partners.tolist()):
+        if i != j:
+            chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
+            changed = True
+    return changed
 
-    # Copia fatia do primeiro pai
-    child[a:b] = parent1[a:b]
 
-    # Preenche o resto na ordem do segundo pai
-    pos = b
-    for gene in parent2[b:] + parent2[:b]:
-        if gene not in child:
-            if pos >= size:
-                pos = 0
+def power_law_mutation_rates(n_children: int, n_jobs: int, beta: float = 1.5) -> np.ndarray:
+    """
+    Taxas de mutação de cauda pesada do "fast GA" (Doerr et al., 2017):
+    para cada filho, sorteia alpha em [1, n_jobs / 2] com densidade proporcional
+    a alpha^(-beta) (inversa da CDF) e usa a taxa alpha / n_jobs.
+    Na maioria das vezes a taxa é ~1/n, mas às vezes há saltos grandes.
+    """
+    return _power_law_rate(np.random.random(n_children), n_jobs, beta)
+
+
+def _power_law_rate(u, n_jobs: int, beta: float = 1.5):
+    """
+    Taxa alpha / n_jobs de power_law_mutation_rates para um sorteio uniforme u
+    em [0, 1) (u pode ser um float ou um array).
+    """
+    alpha_max = max(n_jobs / 2.0, 1.0)
+    e = 1.0 - beta
+    alpha = (1.0 - u * (1.0 - alpha_max ** e)) ** (1.0 / e)
+    return alpha / n_jobs
+
+
+@njit(cache=True)
+def _ox_fill(parent1, parent2, child, a, b):
+    """
+    Núcleo do OX com os pontos de corte já sorteados: copia parent1[a:b] e
+    preenche o resto na ordem de parent2, usando um bitmap de genes presentes.
+    """
+    size = parent1.shape[0]
+    present = np.zeros(size, dtype=np.uint8)
+
+    # Copia fatia do primeiro pai
+    for i in range(a, b):
+        child[i] = parent1[i]
+        present[parent1[i]] = 1
+
+    # Preenche o resto (posições b..size-1 e depois 0..a-1) na ordem do segundo pai
+    pos = b if b < size else 0
+    for k in range(size):
+        i = b + k
+        if i >= size:
+            i -= size
+        gene = parent2[i]
+        if present[gene] == 0:
             child[pos] = gene
+            present[gene] = 1
             pos += 1
+            if pos >= size:
+                pos = 0
 
-    return child
 
+@njit(cache=True)
+def _swap_mutate(chromosome, rand_mut, rand_partner, mutation_rate):
+    """
+    Mutação por troca com sorteios pré-gerados: a posição i é trocada com
+    rand_partner[i] quando rand_mut[i] < mutation_rate.
+    Retorna True se alguma troca alterou o cromossomo.
+    """
+    changed = False
+    for i in range(chromosome.shape[0]):
+        if rand_mut[i] < mutation_rate:
+            j = rand_partner[i]
+            if i != j:
+                tmp = chromosome[i]
+                chromosome[i] = chromosome[j]
+                chromosome[j] = tmp
+                changed = True
+    return changed
+
+
+@njit(cache=True)
+def breed_and_eval(p1, p2, a, b, rand_mut, rand_partner, mutation_rate,
+                   setup, p, r, out_child, machine_time, last_job):
+    """
+    Crossover OX + mutação + avaliação de um filho em um único kernel.
 
-def mutate_swap(chromosome: List[int], mutation_rate: float = 0.02):
+    Escreve o filho em out_child e retorna o makespan. machine_time e last_job
+    são buffers de trabalho (zerados / -1 pelo chamador).
     """
-    Mutação por troca (swap):
-    para cada posição, com probabilidade mutation_rate, troca com outra posição aleatória.
+    _ox_fill(p1, p2, out_child, a, b)
+    _swap_mutate(out_child, rand_mut, rand_partner, mutation_rate)
+    return _decode_makespan(out_child, machine_time, last_job, setup, p, r)
+
+
+@njit(parallel=True, cache=True)
+def _breed_generation_numba(chroms, rows, parent1_rows, parent2_rows, cut_a, cut_b,
+                      rand_mut, rand_partner, mutation_rates, setup, p, r,
+                      n_machines, new_chroms, new_costs):
+    """
+    Gera e avalia em paralelo todos os filhos de crossover de uma geração.
+    O filho i é gravado na linha rows[i] dos buffers da nova população, usando
+    a taxa de mutação mutation_rates[rows[i]].
+    """
+    for i in prange(rows.shape[0]):
+        row = rows[i]
+        machine_time = np.zeros(n_machines, dtype=np.float64)
+        last_job = np.full(n_machines, -1, dtype=np.int64)
+        new_costs[row] = breed_and_eval(chroms[parent1_rows[i]], chroms[parent2_rows[i]],
+                                        cut_a[i], cut_b[i], rand_mut[row], rand_partner[row],
+                                        mutation_rates[row], setup, p, r, new_chroms[row],
+                                        machine_time, last_job)
+
+
+def _breed_generation_cython(chroms, rows, parent1_rows, parent2_rows, cut_a, cut_b,
+                             rand_mut, rand_partner, mutation_rates, setup, p, r,
+                             n_machines, new_chroms, new_costs):
+    """Mesma lógica de _breed_generation_numba, com o OX, a mutação e a decodificação em Cython."""
+    machine_time = np.empty(n_machines, dtype=np.float64)
+    last_job = np.empty(n_machines, dtype=np.int64)
+    for i in range(rows.shape[0]):
+        row = rows[i]
+        child = new_chroms[row]
+        _core.order_crossover_c(chroms[parent1_rows[i]], chroms[parent2_rows[i]], child,
+                                cut_a[i], cut_b[i])
+        _core.swap_mutate_c(child, rand_mut[row], rand_partner[row], mutation_rates[row])
+        machine_time.fill(0.0)
+        last_job.fill(-1)
+        new_costs[row] = _core.decode_schedule_c(child, machine_time, last_job, setup, p, r)
+
+
+def _ox_fill_list(parent1, parent2, a, b):
+    """Mesma lógica de _ox_fill sobre listas; retorna o filho."""
+    size = len(parent1)
+    segment = parent1[a:b]
+    present = bytearray(size)
+    for gene in segment:
+        present[gene] = 1
+
+    # Genes restantes na ordem do segundo pai, a partir de b; os primeiros
+    # ocupam as posições b..size-1 e os demais, 0..a-1
+    rest = [gene for gene in parent2[b:] + parent2[:b] if not present[gene]]
+    return rest[size - b:] + segment + rest[:size - b]
+
+
+def _swap_mutate_list(chromosome: List[int], mutation_rate: float,
+                      _random=_rng.random, _randrange=_rng.randrange) -> bool:
     """
+    Mesma lógica de _swap_mutate sobre uma lista, sorteando com _rng.
+    Em vez de um sorteio por posição, sorteia a distância até a próxima posição
+    trocada (distribuição geométrica), o que equivale em distribuição e custa
+    ~mutation_rate * size sorteios. Retorna True se alguma troca alterou o cromossomo.
+    """
+    if mutation_rate <= 0.0:
+        return False
     size = len(chromosome)
-    for i in range(size):
-        if random.random() < mutation_rate:
-            j = random.randrange(size)
+    log_q = math.log(1.0 - mutation_rate) if mutation_rate < 1.0 else -math.inf
+    _log = math.log
+
+    changed = False
+    i = int(_log(1.0 - _random()) / log_q)
+    while i < size:
+        j = _randrange(size)
+        if i != j:
             chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
+            changed = True
+        i += 1 + int(_log(1.0 - _random()) / log_q)
+    return changed
+
+
+def _tournament_list(costs: List[float], k: int, _randrange=_rng.randrange) -> int:
+    """Um torneio de tournament_selection sobre a lista de custos; retorna o índice do vencedor."""
+    n = len(costs)
+    winner = _randrange(n)
+    for _ in range(k - 1):
+        i = _randrange(n)
+        if costs[i] < costs[winner]:
+            winner = i
+    return winner
+
+
+# Implementação dos kernels do GA, escolhida uma única vez: Numba, extensão
+# em Cython ou Python puro sobre listas (nessa ordem de preferência)
+if HAS_NUMBA:
+    _evaluate_batch = _evaluate_batch_numba
+    _breed_generation = _breed_generation_numba
+elif _core is not None:
+    _evaluate_batch = _evaluate_batch_cython
+    _breed_generation = _breed_generation_cython
+else:
+    # Sem kernels compilados, as gerações rodam inteiras em _genetic_algorithm_list
+    _evaluate_batch = _evaluate_batch_list
+    _breed_generation = None
+
+
+def warm_up_kernels(n_jobs: int,
+                    n_machines: int,
+                    processing_times: np.ndarray,
+                    ready_times: np.ndarray,
+                    setup_matrix: np.ndarray):
+    """
+    Executa uma vez os kernels do GA com os mesmos tipos usados em genetic_algorithm,
+    para que a compilação do Numba não entre na medição de tempo.
+    Usa entradas fixas: não consome sorteios de random / np.random.
+    """
+    if not HAS_NUMBA:
+        return
+
+    order = np.arange(n_jobs, dtype=np.int32)
+    chroms = np.vstack([order, order[::-1]])
+    _evaluate_batch(chroms, setup_matrix, processing_times, ready_times, n_machines)
+
+    one = np.ones(1, dtype=np.int64)
+    zero = np.zeros(1, dtype=np.int64)
+    rand_mut = np.ones(chroms.shape)
+    rand_partner = np.zeros(chroms.shape, dtype=np.int64)
+    mutation_rates = np.zeros(2)
+    _breed_generation(chroms, one, zero, one, zero, one * (n_jobs // 2),
+                      rand_mut, rand_partner, mutation_rates,
+                      setup_matrix, processing_times, ready_times,
+                      n_machines, np.empty_like(chroms), np.empty(2))
+
+
+def _genetic_algorithm_list(pop: List[List[int]],
+                            costs: List[float],
+                            n_machines: int,
+                            processing_times: List[float],
+                            ready_times: List[float],
+                            setup_matrix: List[List[float]],
+                            generations: int,
+                            crossover_rate: float,
+                            mutation_rate: float,
+                            tournament_k: int,
+                            fast_ga: bool) -> Dict[str, Any]:
+    """
+    Laço de gerações de genetic_algorithm em Python puro (sem Numba nem Cython).
+
+    Mesma lógica da versão com arrays, mas a população é uma lista de listas, os
+    custos uma lista de floats e os sorteios saem de _rng, um filho por vez: não há
+    NumPy dentro do laço. Os sorteios são outros, então o resultado para uma mesma
+    semente difere do obtido com Numba ou Cython.
+    """
+    _random = _rng.random
+    _randrange = _rng.randrange
+    pop_size = len(pop)
+    n_jobs = len(pop[0])
+
+    # Os cromossomos nunca são alterados no lugar (filhos são listas novas),
+    # então a nova população pode compartilhar as listas dos pais
+    elite_i = min(range(pop_size), key=costs.__getitem__)
+    best_chromosome = pop[elite_i]
+    best_cost = costs[elite_i]
+    best_history = [best_cost]  # geração 0 (solução inicial)
+
+    for gen in range(generations):
+        # Elitismo
+        if costs[elite_i] < best_cost:
+            best_chromosome = pop[elite_i]
+            best_cost = costs[elite_i]
+        new_pop = [pop[elite_i]]
+        new_costs = [costs[elite_i]]
+
+        # Gera o restante da nova população
+        while len(new_pop) < pop_size:
+            i1 = _tournament_list(costs, tournament_k, _randrange)
+            i2 = _tournament_list(costs, tournament_k, _randrange)
+            parent1 = pop[i1]
+            parent2 = pop[i2]
+            n_children = min(2, pop_size - len(new_pop))
+
+            # OX entre pais iguais só reproduz o pai: nesse caso basta copiar
+            if parent1 != parent2 and _random() < crossover_rate:
+                pairs = ((parent1, parent2), (parent2, parent1))[:n_children]
+                children = [_ox_fill_list(a_parent, b_parent, *_cut_points(n_jobs, _randrange))
+                            for a_parent, b_parent in pairs]
+                child_costs = [None] * n_children
+            else:
+                children = [parent1[:], parent2[:]][:n_children]
+                child_costs = [costs[i1], costs[i2]][:n_children]
+
+            for child, cost in zip(children, child_costs):
+                rate = _power_law_rate(_random(), n_jobs) if fast_ga else mutation_rate
+                # Cópias que continuam iguais ao pai herdam o custo sem reavaliar
+                if _swap_mutate_list(child, rate, _random, _randrange) or cost is None:
+                    cost = _decode_makespan_list(child, n_machines, setup_matrix,
+                                                 processing_times, ready_times)
+                new_pop.append(child)
+                new_costs.append(cost)
+
+        pop = new_pop
+        costs = new_costs
+
+        # Melhor desta geração (para o histórico e para o elitismo da próxima)
+        elite_i = min(range(pop_size), key=costs.__getitem__)
+        best_history.append(costs[elite_i])
+
+        if (gen + 1) % 10 == 0:
+            print(f"Geração {gen + 1}: melhor makespan = {best_cost:.2f}")
+
+    best = {"chromosome": list(best_chromosome), "cost": best_cost}
+    return {"best": best, "history": best_history}
 
 
 def genetic_algorithm(n_jobs: int,
                       n_machines: int,
-                      processing_times: List[float],
-                      ready_times: List[float],
-                      setup_matrix: List[List[float]],
+                      processing_times: np.ndarray,
+                      ready_times: np.ndarray,
+                      setup_matrix: np.ndarray,
                       pop_size: int = 30,
                       generations: int = 50,
                       crossover_rate: float = 0.9,
                       mutation_rate: float = 0.02,
-                      tournament_k: int = 3) -> Dict[str, Any]:
+                      tournament_k: int = 3,
+                      warm_start: bool = False,
+                      fast_ga: bool = False) -> Dict[str, Any]:
     """
     Implementação simples de um Algoritmo Genético para o PMSP.
+    A população é mantida como arrays (matriz de cromossomos + vetor de custos);
+    sem Numba nem Cython, as gerações rodam sobre listas em _genetic_algorithm_list.
+    Com warm_start=True, parte da população inicial vem de heurísticas (ver create_population).
+    Com fast_ga=True, cada filho usa uma taxa de mutação sorteada de uma lei de
+    potência (ver power_law_mutation_rates) no lugar de mutation_rate.
 
     Retorna:
       {
-        "best": melhor_individuo,
+        "best": melhor_individuo ({"chromosome": lista, "cost": makespan}),
         "history": lista_com_melhor_makespan_por_geração (inclui geração 0)
       }
     """
-    # População inicial
-    population = [
-        create_individual(n_jobs, n_machines, processing_times, ready_times, setup_matrix)
-        for _ in range(pop_size)
-    ]
-
-    # Melhor da população inicial
-    best = min(population, key=lambda ind: ind["cost"])
-    best_history = [best["cost"]]  # geração 0 (solução inicial)
+    _rng.seed(random.getrandbits(64))
+    _random = _rng.random
+    _randrange = _rng.randrange
+
+    # População inicial (chroms: uma permutação por linha; costs: makespan de cada linha)
+    chroms, costs = create_population(pop_size, n_jobs, n_machines,
+                                      processing_times, ready_times, setup_matrix,
+                                      warm_start=warm_start)
+    # Dados da instância no formato dos kernels (convertidos uma vez só)
+    k_setup, k_p, k_r = _kernel_inputs(setup_matrix, processing_times, ready_times)
+
+    if _breed_generation is None:
+        return _genetic_algorithm_list(chroms.tolist(), costs.tolist(), n_machines,
+                                       k_p, k_r, k_setup, generations, crossover_rate,
+                                       mutation_rate, tournament_k, fast_ga)
+
+    # Buffers da próxima geração (trocados com os atuais a cada geração)
+    new_chroms = np.empty_like(chroms)
+    new_costs = np.empty_like(costs)
+    dirty = np.zeros(pop_size, dtype=np.bool_)
+
+    # Melhor da população inicial; elite_i é reaproveitado no elitismo da geração seguinte
+    elite_i = int(costs.argmin())
+    best_chromosome = chroms[elite_i].copy()
+    best_cost = float(costs[elite_i])
+    best_history = [best_cost]  # geração 0 (solução inicial)
 
     for gen in range(generations):
-        new_population: List[Dict[str, Any]] = []
-
         # Elitismo
-        elite = min(population, key=lambda ind: ind["cost"])
-        if elite["cost"] < best["cost"]:
-            best = elite
-        new_population.append({
-            "chromosome": elite["chromosome"][:],
-            "cost": elite["cost"]
-        })
+        if costs[elite_i] < best_cost:
+            best_chromosome[:] = chroms[elite_i]
+            best_cost = float(costs[elite_i])
+        new_chroms[0] = chroms[elite_i]
+        new_costs[0] = costs[elite_i]
+        dirty[:] = False
+
+        # Sorteia de uma vez os pais de toda a geração e a mutação dos filhos de crossover
+        parents = tournament_selection(costs, pop_size, tournament_k).tolist()
+        next_parent = 0
+        rand_mut = np.random.random((pop_size, n_jobs))
+        rand_partner = np.random.randint(0, n_jobs, (pop_size, n_jobs), dtype=np.int64)
+        if fast_ga:
+            mutation_rates = power_law_mutation_rates(pop_size, n_jobs)
+        else:
+            mutation_rates = np.full(pop_size, mutation_rate)
+        # Filhos de crossover: (linha, pai 1, pai 2, corte a, corte b)
+        xo = []
 
         # Gera o restante da nova população
-        while len(new_population) < pop_size:
-            parent1 = tournament_selection(population, tournament_k)["chromosome"]
-            parent2 = tournament_selection(population, tournament_k)["chromosome"]
-
-            if random.random() < crossover_rate:
-                child1 = order_crossover(parent1, parent2)
-                child2 = order_crossover(parent2, parent1)
+        pos = 1
+        while pos < pop_size:
+            i1 = parents[next_parent]
+            i2 = parents[next_parent + 1]
+            next_parent += 2
+            has_child2 = pos + 1 < pop_size
+
+            # OX entre pais iguais só reproduz o pai: nesse caso basta copiar
+            same_parents = i1 == i2 or np.array_equal(chroms[i1], chroms[i2])
+
+            if not same_parents and _random() < crossover_rate:
+                # Crossover, mutação e avaliação ficam para o kernel da geração
+                xo.append((pos, i1, i2) + _cut_points(n_jobs, _randrange))
+                if has_child2:
+                    xo.append((pos + 1, i2, i1) + _cut_points(n_jobs, _randrange))
             else:
-                child1 = parent1[:]
-                child2 = parent2[:]
-
-            mutate_swap(child1, mutation_rate)
-            mutate_swap(child2, mutation_rate)
-
-            cost1 = evaluate(child1, n_machines, processing_times, ready_times, setup_matrix)
-            new_population.append({"chromosome": child1, "cost": cost1})
-
-            if len(new_population) < pop_size:
-                cost2 = evaluate(child2, n_machines, processing_times, ready_times, setup_matrix)
-                new_population.append({"chromosome": child2, "cost": cost2})
-
-        population = new_population
-
-        # Melhor desta geração (para o histórico)
-        best_gen = min(population, key=lambda ind: ind["cost"])
-        best_history.append(best_gen["cost"])
+                new_chroms[pos] = chroms[i1]
+                new_costs[pos] = costs[i1]
+                if has_child2:
+                    new_chroms[pos + 1] = chroms[i2]
+                    new_costs[pos + 1] = costs[i2]
+
+                # Filhos que continuam iguais ao pai herdam o custo sem reavaliar
+                if mutate_swap(new_chroms[pos], mutation_rates[pos]):
+                    dirty[pos] = True
+                if has_child2 and mutate_swap(new_chroms[pos + 1], mutation_rates[pos + 1]):
+                    dirty[pos + 1] = True
+
+            pos += 2
+
+        # Filhos de crossover: OX + mutação + avaliação fundidos, em paralelo
+        if xo:
+            xo_rows, xo_p1, xo_p2, xo_a, xo_b = (np.array(col, dtype=np.int64) for col in zip(*xo))
+            _breed_generation(chroms, xo_rows, xo_p1, xo_p2, xo_a, xo_b,
+                              rand_mut, rand_partner, mutation_rates,
+                              k_setup, k_p, k_r, n_machines, new_chroms, new_costs)
+
+        # Avalia todos os filhos alterados desta geração de uma vez (em paralelo)
+        pending = np.flatnonzero(dirty)
+        if pending.size:
+            new_costs[pending] = evaluate_batch(new_chroms[pending], n_machines, k_p, k_r, k_setup)
+
+        chroms, new_chroms = new_chroms, chroms
+        costs, new_costs = new_costs, costs
+
+        # Melhor desta geração (para o histórico e para o elitismo da próxima)
+        elite_i = int(costs.argmin())
+        best_history.append(float(costs[elite_i]))
 
         if (gen + 1) % 10 == 0:
-            print(f"Geração {gen + 1}: melhor makespan = {best['cost']:.2f}")
+            print(f"Geração {gen + 1}: melhor makespan = {best_cost:.2f}")
 
+    best = {"chromosome": best_chromosome.tolist(), "cost": best_cost}
     return {"best": best, "history": best_history}
 
 
@@ -254,34 +793,28 @@ def calcular_ddlb(config, processing_times, setup_matrix, ready_times):
     n_jobs = config['n_jobs']
     n_machines = config['n_maquinas']
 
-    # 1) δ_i = menor setup saindo de i
-    deltas = []
-    for i in range(n_jobs):
-        min_setup_i = min(
-            setup_matrix[i][j]
-            for j in range(n_jobs)
-            if j != i and setup_matrix[i][j] is not None
-        )
-        deltas.append(min_setup_i)
+    # 1) δ_i = menor setup saindo de i (a diagonal não conta: vira inf)
+    setup = np.array(setup_matrix, dtype=np.float64)
+    np.fill_diagonal(setup, np.inf)
+    deltas = setup.min(axis=1)
+
+    p = np.asarray(processing_times, dtype=np.float64)
+    r = np.asarray(ready_times, dtype=np.float64)
 
     # 2) soma dos p_i e δ_i
-    soma_p = sum(processing_times)
-    soma_deltas = sum(deltas)
+    soma_p = float(p.sum())
+    soma_deltas = float(deltas.sum())
 
     # 3) setup total mínimo (tirando os m maiores δ_i, que podem ser "não pagos"
-    #    pelos últimos jobs de cada máquina)
-    deltas_ordenados = sorted(deltas, reverse=True)
-    soma_maiores = sum(deltas_ordenados[:n_machines])
+    #    pelos últimos jobs de cada máquina); np.partition evita ordenar tudo
+    k = min(n_machines, n_jobs)
+    soma_maiores = float(np.partition(deltas, n_jobs - k)[n_jobs - k:].sum())
     setup_total_minimo = soma_deltas - soma_maiores
 
     limite_carga_trabalho = (soma_p + setup_total_minimo) / n_machines
 
     # 4) Limite de caminho crítico *sem* δ_i
-    limite_caminho_critico = 0.0
-    for i in range(n_jobs):
-        caminho_i = ready_times[i] + processing_times[i]  # <-- SEM deltas aqui
-        if caminho_i > limite_caminho_critico:
-            limite_caminho_critico = caminho_i
+    limite_caminho_critico = float((r + p).max())
 
     ddlb = max(limite_carga_trabalho, limite_caminho_critico)
     return ddlb
@@ -345,10 +878,12 @@ def salvar_resultado_csv(
 # 5. Orquestração e Execução Principal (estilo ls_pmsp)
 # -------------------------------------------------------
 
-def run_scenario_from_file(file_path: str):
+def run_scenario_from_file(file_path: str, warm_start: bool = False, fast_ga: bool = False):
     """
     Orquestra o processo: carregar instância, rodar GA e exibir resultados
     em um formato parecido com o ls_pmsp.py.
+    warm_start: semeia a população inicial com heurísticas (opção --warm-start).
+    fast_ga: usa taxas de mutação de cauda pesada (opção --fast-ga).
     """
     print("=" * 50)
     print(f"EXECUTANDO CENÁRIO DO ARQUIVO: {file_path}")
@@ -368,21 +903,29 @@ def run_scenario_from_file(file_path: str):
     n_jobs = config["n_jobs"]
     scenario_code = config.get("codigo_cenario", "Cenário Desconhecido")
 
+    # Converte os dados uma única vez para arrays NumPy usados pelo GA
+    p_np, r_np, setup_np = prepare_arrays(processing_times, ready_times, setup_matrix)
+
     # --- Rodar GA ---
     print("\n[FASE 1: APLICANDO ALGORITMO GENÉTICO]")
 
+    # Compila os kernels antes de iniciar a medição de tempo
+    warm_up_kernels(n_jobs, n_machines, p_np, r_np, setup_np)
+
     start_time = time.time()
     result = genetic_algorithm(
         n_jobs=n_jobs,
         n_machines=n_machines,
-        processing_times=processing_times,
-        ready_times=ready_times,
-        setup_matrix=setup_matrix,
+        processing_times=p_np,
+        ready_times=r_np,
+        setup_matrix=setup_np,
         pop_size=50,
         generations=200,
         crossover_rate=0.9,
         mutation_rate=0.02,
         tournament_k=3,
+        warm_start=warm_start,
+        fast_ga=fast_ga,
     )
     end_time = time.time()
     tempo_ga = end_time - start_time
@@ -404,9 +947,9 @@ def run_scenario_from_file(file_path: str):
     best_makespan, best_schedule = decode_schedule(
         best_individual["chromosome"],
         n_machines,
-        processing_times,
-        ready_times,
-        setup_matrix,
+        p_np,
+        r_np,
+        setup_np,
     )
 
     # --- Calcula o DDLB ---
@@ -448,6 +991,7 @@ def run_scenario_from_file(file_path: str):
 
 if __name__ == "__main__":
     random.seed(42)
+    np.random.seed(42)
 
     parser = argparse.ArgumentParser(
         description="Resolve o PMSP com Algoritmo Genético a partir de um arquivo de instância JSON."
@@ -457,6 +1001,17 @@ if __name__ == "__main__":
         type=str,
         help="Caminho para o arquivo .json da instância do problema."
     )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Semeia a população inicial com heurísticas (ready time, LPT, r + p)."
+    )
+
+    parser.add_argument(
+        "--fast-ga",
+        action="store_true",
+        help="Sorteia a taxa de mutação de cada filho de uma lei de potência (fast GA)."
+    )
 
     args = parser.parse_args()
-    run_scenario_from_file(args.caminho_arquivo)
+    run_scenario_from_file(args.caminho_arquivo, warm_start=args.warm_start, fast_ga=args.fast_ga)
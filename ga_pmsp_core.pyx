@@ -0,0 +1,116 @@
+# cython: language_level=3
+"""
+Versões em Cython dos laços mais pesados do ga_pmsp.py.
+
+Alternativa ao Numba: compile com
+
+    python setup.py build_ext --inplace
+
+e, quando o Numba não estiver instalado, o ga_pmsp.py passa a usar este módulo
+automaticamente. Sem ele (ou sem compilar), o ga_pmsp.py continua funcionando
+com as versões em Python/Numba.
+"""
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_schedule_c(int[::1] order,
+                      double[::1] machine_time,
+                      long long[::1] last_job,
+                      double[:, ::1] setup,
+                      double[::1] p,
+                      double[::1] r):
+    """
+    Mesma lógica de _decode_makespan: retorna só o makespan.
+    machine_time e last_job são buffers de trabalho (zerados / -1 pelo chamador).
+    """
+    cdef Py_ssize_t n_machines = machine_time.shape[0]
+    cdef Py_ssize_t idx, m, best_machine
+    cdef int job
+    cdef double t, start, completion, best_completion, makespan
+
+    for idx in range(order.shape[0]):
+        job = order[idx]
+        best_machine = 0
+        best_completion = 1e308
+
+        for m in range(n_machines):
+            # linha 0 de setup é zero (máquina sem job anterior)
+            t = machine_time[m] + setup[last_job[m] + 1, job]
+            start = t if t > r[job] else r[job]
+            completion = start + p[job]
+
+            if completion < best_completion:
+                best_completion = completion
+                best_machine = m
+
+        machine_time[best_machine] = best_completion
+        last_job[best_machine] = job
+
+    makespan = 0.0
+    for m in range(n_machines):
+        if machine_time[m] > makespan:
+            makespan = machine_time[m]
+    return makespan
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def order_crossover_c(int[::1] parent1,
+                      int[::1] parent2,
+                      int[::1] child,
+                      Py_ssize_t a,
+                      Py_ssize_t b):
+    """
+    Order Crossover (OX) com os pontos de corte a, b já sorteados.
+    Escreve o filho em child.
+    """
+    cdef Py_ssize_t size = parent1.shape[0]
+    cdef Py_ssize_t i, k, pos
+    cdef int gene
+    cdef unsigned char[::1] present = bytearray(size)
+
+    # Copia fatia do primeiro pai
+    for i in range(a, b):
+        child[i] = parent1[i]
+        present[parent1[i]] = 1
+
+    # Preenche o resto (posições b..size-1 e depois 0..a-1) na ordem do segundo pai
+    pos = b if b < size else 0
+    for k in range(size):
+        i = b + k
+        if i >= size:
+            i -= size
+        gene = parent2[i]
+        if not present[gene]:
+            child[pos] = gene
+            present[gene] = 1
+            pos += 1
+            if pos >= size:
+                pos = 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_mutate_c(int[::1] chromosome,
+                  double[::1] rand_mut,
+                  long long[::1] rand_partner,
+                  double mutation_rate):
+    """
+    Mesma lógica de _swap_mutate: troca a posição i com rand_partner[i] quando
+    rand_mut[i] < mutation_rate. Retorna True se alguma troca alterou o cromossomo.
+    """
+    cdef Py_ssize_t i, j
+    cdef int tmp
+    cdef bint changed = False
+
+    for i in range(chromosome.shape[0]):
+        if rand_mut[i] < mutation_rate:
+            j = rand_partner[i]
+            if i != j:
+                tmp = chromosome[i]
+                chromosome[i] = chromosome[j]
+                chromosome[j] = tmp
+                changed = True
+    return changed
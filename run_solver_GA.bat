@@ -16,6 +16,8 @@ set "ROOT_FOLDER=%~dp0"
 set "INSTANCIAS_FOLDER=%ROOT_FOLDER%instancias"
 set "SOLVER_SCRIPT=%ROOT_FOLDER%ga_pmsp.py"
 set "RESULTS_FILE=%ROOT_FOLDER%resultados_GA.txt"
+REM Interpretador usado para rodar o solver (ex.: "pypy3" para usar o PyPy).
+set "PYTHON_CMD=py"
 
 REM --- Verificações Iniciais ---
 REM Verifica se o script do solver existe.
@@ -52,7 +54,7 @@ for /r "%INSTANCIAS_FOLDER%" %%f in (*.json) do (
     
     REM Executa o script Python para o arquivo encontrado.
     REM A saida normal (stdout) e a saida de erro (stderr) sao anexadas (>>) ao arquivo de resultados.
-    py "%SOLVER_SCRIPT%" "%%f" >> "%RESULTS_FILE%" 2>>&1
+    %PYTHON_CMD% "%SOLVER_SCRIPT%" "%%f" >> "%RESULTS_FILE%" 2>>&1
 )
 
 echo. >> "%RESULTS_FILE%"
@@ -0,0 +1,13 @@
+"""
+Compila a extensão opcional em Cython (ga_pmsp_core):
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="ga_pmsp_core",
+    ext_modules=cythonize("ga_pmsp_core.pyx", language_level=3),
+)